@@ -2,32 +2,53 @@
 
 import pygame
 from tienlen_gui import load_card_images, get_card_image
-from tien_len_full import Card
+from tienlen import Card
+
+BG_COLOR = (0, 128, 0)
 
 pygame.init()
 screen = pygame.display.set_mode((400, 300))
 pygame.display.set_caption("Card Click Demo")
 
-# Load card images at default width
-load_card_images(80)
-# Get a scaled image and its rect after scaling
-card_img = get_card_image(Card('spades', 'A'), 80)  # Ace of spades
-scaled_img = pygame.transform.smoothscale(card_img, (120, int(card_img.get_height() * 120 / card_img.get_width())))
+# Load card images at the demo width so no further rescaling is needed
+load_card_images(120)
+# Get the pre-scaled image and its rect
+scaled_img = get_card_image(Card('Spades', 'A'), 120)  # Ace of spades
 card_rect = scaled_img.get_rect(topleft=(140, 90))
 
-clock = pygame.time.Clock()
+# Only queue the events the demo handles so the loop never sees the rest
+HANDLED_EVENTS = (pygame.QUIT, pygame.MOUSEBUTTONDOWN)
+pygame.event.set_blocked(None)
+pygame.event.set_allowed(HANDLED_EVENTS)
+
+# Maximum time to block waiting for input before looping again
+IDLE_TIMEOUT_MS = 250
+
+# Draw the static scene once; the loop only repaints what a click changes
+screen.fill(BG_COLOR)
+screen.blit(scaled_img, card_rect)
+pygame.display.flip()
 
 running = True
 while running:
-    for event in pygame.event.get():
+    dirty = []
+    # Sleep in SDL until input arrives, then drain anything else queued
+    events = [pygame.event.wait(IDLE_TIMEOUT_MS)]
+    events.extend(pygame.event.get(eventtype=HANDLED_EVENTS))
+    for event in events:
         if event.type == pygame.QUIT:
             running = False
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if card_rect.collidepoint(event.pos):
                 print("Card clicked!")
-    screen.fill((0, 128, 0))
-    screen.blit(scaled_img, card_rect)
-    pygame.display.flip()
-    clock.tick(60)
+                # Lift or lower the card like a selection in the game
+                old_rect = card_rect.copy()
+                card_rect.y += -10 if card_rect.y == 90 else 10
+                dirty.append(old_rect.union(card_rect))
+    if dirty:
+        for rect in dirty:
+            screen.fill(BG_COLOR, rect)
+        screen.blit(scaled_img, card_rect)
+        pygame.display.update(dirty)
 
 pygame.quit()
@@ -220,7 +220,9 @@ def calc_fan_layout(
 # Helpers for loading and caching card images
 # ---------------------------------------------------------------------------
 
-_CARD_CACHE: Dict[Tuple[str, int], pygame.Surface] = {}
+# Cache for scaled card faces and backs keyed by (image_key, width)
+_CARD_CACHE: OrderedDict[Tuple[str, int], pygame.Surface] = OrderedDict()
+_CARD_CACHE_SIZE = 256
 _BASE_IMAGES: Dict[str, pygame.Surface] = {}
 # Cache for card shadow surfaces keyed by (width, height)
 _SHADOW_CACHE: Dict[Tuple[int, int], pygame.Surface] = {}
@@ -279,14 +281,18 @@ def _image_key(card: Card) -> str:
     return f"{rank}_of_{suit}"
 
 
+def _display_format(img: pygame.Surface) -> pygame.Surface:
+    """Return ``img`` converted to the display's pixel format when possible."""
+    if pygame.display.get_surface():
+        return img.convert_alpha()
+    return img
+
+
 def load_nine_patch(name: str) -> pygame.Surface:
     """Return a nine-patch image from ``assets/buttons``."""
     if name not in _NINE_PATCH_CACHE:
         path = ASSETS_DIR / "buttons" / f"{name}.png"
-        img = pygame.image.load(str(path))
-        if pygame.display.get_surface():
-            img = img.convert_alpha()
-        _NINE_PATCH_CACHE[name] = img
+        _NINE_PATCH_CACHE[name] = _display_format(pygame.image.load(str(path)))
     return _NINE_PATCH_CACHE[name]
 
 
@@ -355,17 +361,13 @@ def load_card_images(width: int = 80) -> None:
     """Load all card images scaled to ``width`` pixels."""
     cards = ASSETS_DIR / "cards"
     for img in cards.glob("*_of_*.png"):
-        key = img.stem
-        base = pygame.image.load(str(img)).convert_alpha()
-        _BASE_IMAGES[key] = base
+        _BASE_IMAGES[img.stem] = _display_format(pygame.image.load(str(img)))
     backs = ASSETS_DIR / "card_backs"
     for img in backs.glob("*.png"):
-        _BASE_IMAGES[img.stem] = pygame.image.load(str(img)).convert_alpha()
-    for key, base in _BASE_IMAGES.items():
-        ratio = width / base.get_width()
-        _CARD_CACHE[(key, width)] = pygame.transform.smoothscale(
-            base, (width, int(base.get_height() * ratio))
-        )
+        _BASE_IMAGES[img.stem] = _display_format(pygame.image.load(str(img)))
+    for key in _BASE_IMAGES:
+        _CARD_CACHE.pop((key, width), None)
+        _scaled_card(key, width)
 
     # Rebuild the shadow cache when card sizes change
     global _SHADOW_SIZE
@@ -378,30 +380,30 @@ def load_card_images(width: int = 80) -> None:
             _SHADOW_SIZE = size
 
 
-def get_card_back(name: str = "card_back", width: int = 80) -> Optional[pygame.Surface]:
-    if name not in _BASE_IMAGES:
-        return None
+def _scaled_card(name: str, width: int) -> Optional[pygame.Surface]:
+    """Return the base image ``name`` scaled to ``width`` using an LRU cache."""
     key = (name, width)
-    if key not in _CARD_CACHE:
-        base = _BASE_IMAGES[name]
+    surf = _CARD_CACHE.get(key)
+    if surf is None:
+        base = _BASE_IMAGES.get(name)
+        if base is None:
+            return None
         ratio = width / base.get_width()
-        _CARD_CACHE[key] = pygame.transform.smoothscale(
-            base, (width, int(base.get_height() * ratio))
-        )
-    return _CARD_CACHE[key]
+        surf = _display_format(pygame.transform.smoothscale(base, (width, int(base.get_height() * ratio))))
+        _CARD_CACHE[key] = surf
+        if len(_CARD_CACHE) > _CARD_CACHE_SIZE:
+            _CARD_CACHE.popitem(last=False)
+    else:
+        _CARD_CACHE.move_to_end(key)
+    return surf
+
+
+def get_card_back(name: str = "card_back", width: int = 80) -> Optional[pygame.Surface]:
+    return _scaled_card(name, width)
 
 
 def get_card_image(card: Card, width: int) -> Optional[pygame.Surface]:
-    key = _image_key(card)
-    if (key, width) not in _CARD_CACHE:
-        base = _BASE_IMAGES.get(key)
-        if base is None:
-            return None
-        ratio = width / base.get_width()
-        _CARD_CACHE[(key, width)] = pygame.transform.smoothscale(
-            base, (width, int(base.get_height() * ratio))
-        )
-    return _CARD_CACHE[(key, width)]
+    return _scaled_card(_image_key(card), width)
 
 
 # ---------------------------------------------------------------------------
@@ -430,6 +432,7 @@ class CardSprite(pygame.sprite.Sprite):
         surf.blit(img, (border, border))
 
         self.base_image = surf
+        self.width = width
         self.angle = rotation
         self.scale = 1.0
         self.image = surf.copy()
@@ -440,6 +443,17 @@ class CardSprite(pygame.sprite.Sprite):
         self.card = card
         self.selected = False
 
+    def reset(self, pos: Tuple[int, int], rotation: float = 0.0) -> None:
+        """Restore the unscaled, unselected image at ``pos`` with ``rotation``."""
+        self.angle = rotation
+        self.scale = 1.0
+        self.image = self.base_image.copy()
+        if rotation:
+            self.image = pygame.transform.rotate(self.image, rotation)
+        self.rect = self.image.get_rect(topleft=pos)
+        self.pos.update(self.rect.center)
+        self.selected = False
+
     def toggle(self) -> None:
         self.selected = not self.selected
         offset = -10 if self.selected else 10
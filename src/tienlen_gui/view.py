@@ -4,14 +4,14 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Tuple, List, Optional
+from typing import Dict, Tuple, List, Optional, Set
 import gc
 import tracemalloc
 
 import pygame
 import types
 
-from tienlen import Game, detect_combo
+from tienlen import Card, Game, detect_combo
 from tienlen import sound
 
 from .helpers import (
@@ -52,6 +52,9 @@ logger = logging.getLogger(__name__)
 # Number of cards required to switch to a fanned layout for the human player
 FAN_THRESHOLD = 16
 
+# Minimum delay between layout rebuilds while the window is being resized
+RESIZE_DEBOUNCE_MS = 33
+
 
 class GameView(AnimationMixin, HUDMixin, OverlayMixin):
     TABLE_COLOR = TABLE_THEMES["darkgreen"]
@@ -69,6 +72,9 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
         self.clock = pygame.time.Clock()
         self.dt = 1 / 60  # default frame time for tests
         self.fps_limit = 60
+        # Latest VIDEORESIZE size and its arrival time, applied once settled
+        self._pending_resize: Optional[Tuple[int, int]] = None
+        self._resize_ticks = 0
         self.animation_speed = 1.0
         self.animations: list = []
         self.anim_managers: Dict[pygame.sprite.Sprite, AnimationManager] = {}
@@ -132,7 +138,9 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
                 pygame.mixer.music.play(-1)
             except Exception:
                 pass
-        self.selected: List[CardSprite] = []
+        self.selected: Set[CardSprite] = set()
+        # Human hand sprites from the last layout keyed by card for reuse
+        self._card_sprites: Dict[Card, CardSprite] = {}
         self.current_trick: list[tuple[str, pygame.Surface]] = []
         self.ai_sprites: List[pygame.sprite.LayeredUpdates] = [
             pygame.sprite.LayeredUpdates() for _ in range(3)
@@ -795,11 +803,15 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
         self.update_hand_sprites()
         self._create_action_buttons()
 
+    def _selected_sprites(self) -> List[CardSprite]:
+        """Return the selected sprites ordered left to right."""
+        return sorted(self.selected, key=lambda sp: sp.rect.x)
+
     def update_play_button_state(self) -> None:
         """Enable the Play button only when the current selection is valid."""
         if not self.action_buttons:
             return
-        cards = [sp.card for sp in self.selected]
+        cards = [sp.card for sp in self._selected_sprites()]
         if not cards:
             self.action_buttons[0].enabled = False
             return
@@ -839,16 +851,16 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
         if self.settings_button.rect.collidepoint(pos):
             self.settings_button.callback()
             return
-        for sp in reversed(self.selected):
+        for sp in reversed(self._selected_sprites()):
             if sp.rect.collidepoint(pos):
                 up = not sp.selected
                 sp.toggle()
                 if isinstance(sp, CardSprite):
                     self._start_animation(self._animate_select(sp, up))
                 if sp.selected:
-                    self.selected.append(sp)
+                    self.selected.add(sp)
                 else:
-                    self.selected.remove(sp)
+                    self.selected.discard(sp)
                 self.update_play_button_state()
                 return
         for sp in reversed(self.hand_sprites.sprites()):
@@ -857,10 +869,10 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
                 sp.toggle()
                 if isinstance(sp, CardSprite):
                     self._start_animation(self._animate_select(sp, up))
-                if sp.selected and sp not in self.selected:
-                    self.selected.append(sp)
-                elif not sp.selected and sp in self.selected:
-                    self.selected.remove(sp)
+                if sp.selected:
+                    self.selected.add(sp)
+                else:
+                    self.selected.discard(sp)
                 self.update_play_button_state()
                 return
 
@@ -888,11 +900,12 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
     def play_selected(self):
         if not self.selected:
             return
-        cards = [sp.card for sp in self.selected]
+        sprites = self._selected_sprites()
+        cards = [sp.card for sp in sprites]
         player = self.game.players[self.game.current_idx]
         ok, msg = self.game.is_valid(player, cards, self.game.current_combo)
         if not ok:
-            self._start_animation(self._animate_shake(list(self.selected)))
+            self._start_animation(self._animate_shake(sprites))
             logger.info("Invalid: %s", msg)
             return
         if self.game.process_play(player, cards):
@@ -909,7 +922,6 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
             self._start_animation(self._bomb_reveal())
         else:
             sound.play("click")
-        sprites = list(self.selected)
         self._start_animation(self._animate_flip(sprites, self._pile_center()))
         self._start_animation(
             self._animate_glow(sprites, PLAYER_COLORS[self.game.current_idx])
@@ -933,14 +945,14 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
         for sp in self.hand_sprites.sprites():
             if isinstance(sp, CardSprite) and sp.card in hint:
                 sp.selected = True
-                self.selected.append(sp)
+                self.selected.add(sp)
         self.update_play_button_state()
 
     def pass_turn(self):
         if self.game.handle_pass():
             self.running = False
         else:
-            self._start_animation(self._animate_shake(list(self.selected)))
+            self._start_animation(self._animate_shake(self._selected_sprites()))
             sound.play("pass")
             self._start_animation(
                 self._animate_pass_text(self.game.current_idx)
@@ -1033,6 +1045,17 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
         self._start_animation(self._animate_avatar_blink(self.game.current_idx))
 
     # Rendering -------------------------------------------------------
+    def _hand_sprite(
+        self, card: Card, pos: Tuple[int, int], width: int, rotation: float = 0.0
+    ) -> CardSprite:
+        """Return a sprite for ``card``, reusing the previous layout's sprite."""
+        sprite = self._card_sprites.get(card)
+        if sprite is None or sprite.width != width:
+            return CardSprite(card, pos, width, rotation=rotation)
+        sprite.reset(pos, rotation)
+        sprite.selected = sprite in self.selected
+        return sprite
+
     def update_hand_sprites(self):
         """Create card sprites for all players with a simple table layout."""
 
@@ -1050,7 +1073,7 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
             layout = calc_fan_layout(screen_w, card_w, len(player.hand), self.hand_y, card_w)
             for i, card in enumerate(player.hand):
                 x, y, angle = layout[i]
-                sprite = CardSprite(card, (x, y - card_h // 2), card_w, rotation=angle)
+                sprite = self._hand_sprite(card, (x, y - card_h // 2), card_w, rotation=angle)
                 sprite.pos.y = y
                 sprite.update()
                 sprite._layer = i
@@ -1060,12 +1083,13 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
             start_x, spacing = calc_hand_layout(screen_w, card_w, len(player.hand))
             y = self.hand_y - card_h // 2
             for i, card in enumerate(player.hand):
-                sprite = CardSprite(card, (start_x + i * spacing, y), card_w)
+                sprite = self._hand_sprite(card, (start_x + i * spacing, y), card_w)
                 sprite.pos.y = self.hand_y
                 sprite.update()
                 sprite._layer = i
                 self._manager_for(sprite)
                 self.hand_sprites.add(sprite, layer=i)
+        self._card_sprites = {sp.card: sp for sp in self.hand_sprites}
 
         margin_v = bottom_margin(card_w)
 
@@ -1174,7 +1198,7 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
         # Highlight currently selected cards
         if self.selected:
             player = self.game.players[self.game.current_idx]
-            cards = [sp.card for sp in self.selected if hasattr(sp, "card")]
+            cards = [sp.card for sp in self._selected_sprites() if hasattr(sp, "card")]
             valid = self.game.is_valid(player, cards, self.game.current_combo)[0]
             color = (0, 255, 0) if valid else (255, 0, 0)
             for sp in self.selected:
@@ -1259,13 +1283,25 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.VIDEORESIZE:
-                self.on_resize(event.w, event.h)
+                self._pending_resize = (event.w, event.h)
+                self._resize_ticks = pygame.time.get_ticks()
             elif self._handle_score_event(event):
                 continue
             elif self._dispatch_overlay_event(event):
                 continue
             else:
                 self._dispatch_game_event(event)
+        self._apply_pending_resize()
+
+    def _apply_pending_resize(self) -> None:
+        """Rebuild the layout for the last resize once events settle."""
+        if self._pending_resize is None:
+            return
+        if pygame.time.get_ticks() - self._resize_ticks < RESIZE_DEBOUNCE_MS:
+            return
+        width, height = self._pending_resize
+        self._pending_resize = None
+        self.on_resize(width, height)
 
     def update_state(self, dt: float) -> None:
         for anim in self.animations[:]:
@@ -1274,7 +1310,8 @@ class GameView(AnimationMixin, HUDMixin, OverlayMixin):
             except StopIteration:
                 self.animations.remove(anim)
 
-        for manager in list(self.anim_managers.values()):
+        # Most sprites sit idle between moves; only tick managers with work
+        for manager in [m for m in self.anim_managers.values() if m.active()]:
             manager.update(dt)
 
     def render(self) -> None:
@@ -0,0 +1,37 @@
+import pygame
+import pytest
+
+import tienlen_gui
+from tienlen import Card
+
+pytest.importorskip("pygame")
+
+pytestmark = pytest.mark.gui
+
+
+@pytest.fixture
+def card_cache(monkeypatch):
+    h = tienlen_gui.helpers
+    monkeypatch.setattr(h, "_BASE_IMAGES", {"ace_of_spades": pygame.Surface((50, 70))})
+    monkeypatch.setattr(h, "_CARD_CACHE", type(h._CARD_CACHE)())
+    return h
+
+
+def test_get_card_image_reuses_scaled_surface(card_cache):
+    card = Card("Spades", "A")
+    first = tienlen_gui.get_card_image(card, 20)
+    second = tienlen_gui.get_card_image(card, 20)
+
+    assert first is second
+    assert first.get_size() == (20, 28)
+
+
+def test_card_cache_evicts_least_recently_used(card_cache, monkeypatch):
+    monkeypatch.setattr(card_cache, "_CARD_CACHE_SIZE", 2)
+    card = Card("Spades", "A")
+    first = tienlen_gui.get_card_image(card, 10)
+    tienlen_gui.get_card_image(card, 20)
+    assert tienlen_gui.get_card_image(card, 10) is first
+    tienlen_gui.get_card_image(card, 30)
+
+    assert list(card_cache._CARD_CACHE) == [("ace_of_spades", 10), ("ace_of_spades", 30)]
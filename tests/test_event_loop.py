@@ -65,3 +65,27 @@ def test_event_loop_handles_quit():
         assert get_mock.call_count >= 2
         quit_mock.assert_called_once()
     pygame.quit()
+
+
+def test_resize_events_are_coalesced():
+    view = make_view()
+    events = [
+        pygame.event.Event(pygame.VIDEORESIZE, {"w": 300, "h": 200, "size": (300, 200)}),
+        pygame.event.Event(pygame.VIDEORESIZE, {"w": 400, "h": 300, "size": (400, 300)}),
+    ]
+    with (
+        patch("pygame.event.get", return_value=events),
+        patch("pygame.time.get_ticks", return_value=1000),
+        patch.object(view, "on_resize") as resize,
+    ):
+        view.handle_input()
+        resize.assert_not_called()
+    with (
+        patch("pygame.event.get", return_value=[]),
+        patch("pygame.time.get_ticks", return_value=1000 + tienlen_gui.view.RESIZE_DEBOUNCE_MS),
+        patch.object(view, "on_resize") as resize,
+    ):
+        view.handle_input()
+        view.handle_input()
+        resize.assert_called_once_with(400, 300)
+    pygame.quit()
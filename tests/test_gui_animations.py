@@ -587,3 +587,17 @@ def test_deal_does_not_block_other_animations():
         count += 1
     assert finished_other
     pygame.quit()
+
+
+def test_update_state_skips_idle_managers():
+    view, _ = make_view()
+    idle = MagicMock()
+    idle.active.return_value = False
+    busy = MagicMock()
+    busy.active.return_value = True
+    view.animations = []
+    view.anim_managers = {object(): idle, object(): busy}
+    view.update_state(1 / 60)
+    idle.update.assert_not_called()
+    busy.update.assert_called_once_with(1 / 60)
+    pygame.quit()
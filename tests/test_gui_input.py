@@ -44,7 +44,7 @@ def test_handle_mouse_select_and_overlay():
     sprite = DummySprite()
     center = sprite.rect.center
     view.hand_sprites = pygame.sprite.LayeredUpdates(sprite)
-    view.selected = []
+    view.selected = set()
     view.state = tienlen_gui.GameState.PLAYING
     view.action_buttons = []
 
@@ -70,7 +70,7 @@ def test_handle_mouse_selects_rightmost_sprite():
     left = DummySprite((5, 5))
     right = DummySprite((5, 5))
     view.hand_sprites = pygame.sprite.LayeredUpdates(left, right)
-    view.selected = []
+    view.selected = set()
     view.state = tienlen_gui.GameState.PLAYING
     view.action_buttons = []
     with (
@@ -88,7 +88,7 @@ def test_handle_mouse_selects_rightmost_sprite():
 def test_update_play_button_state_enables_button_on_valid_selection():
     view, _ = make_view()
     card_sprite = DummyCardSprite()
-    view.selected = [card_sprite]
+    view.selected = {card_sprite}
     btn = view.action_buttons[0]
     with patch.object(view.game, "is_valid", return_value=(True, "")) as mock:
         view.update_play_button_state()
@@ -103,7 +103,7 @@ def test_update_play_button_state_enables_button_on_valid_selection():
 def test_update_play_button_state_disables_when_invalid():
     view, _ = make_view()
     card_sprite = DummyCardSprite()
-    view.selected = [card_sprite]
+    view.selected = {card_sprite}
     btn = view.action_buttons[0]
     with patch.object(view.game, "is_valid", return_value=(False, "bad")):
         view.update_play_button_state()
@@ -114,7 +114,7 @@ def test_handle_mouse_calls_update_play_button_state():
     view, _ = make_view()
     sprite = DummyCardSprite((5, 5))
     view.hand_sprites = pygame.sprite.LayeredUpdates(sprite)
-    view.selected = []
+    view.selected = set()
     view.state = tienlen_gui.GameState.PLAYING
     view.action_buttons = []
     with (
@@ -131,3 +131,20 @@ def test_update_hand_sprites_calls_update_play_button_state():
     with patch.object(view, "update_play_button_state") as upd:
         view.update_hand_sprites()
         upd.assert_called_once()
+
+
+def test_update_hand_sprites_reuses_card_sprites():
+    view, _ = make_view()
+    view.update_hand_sprites()
+    before = {sp.card: sp for sp in view.hand_sprites}
+    played = view.game.players[0].hand.pop(0)
+    keep = view.hand_sprites.sprites()[1]
+    keep.selected = True
+    view.selected = {keep}
+
+    view.update_hand_sprites()
+
+    after = {sp.card: sp for sp in view.hand_sprites}
+    assert played not in after
+    assert all(after[c] is before[c] for c in after)
+    assert keep.selected is True
@@ -434,7 +434,7 @@ def test_draw_frame_with_overlay():
 def test_play_selected_triggers_flip():
     view, _ = make_view()
     sprite = DummyCardSprite()
-    view.selected = [sprite]
+    view.selected = {sprite}
     view.hand_sprites = pygame.sprite.LayeredUpdates(sprite)
     dest = view._pile_center()
     with (
@@ -456,7 +456,7 @@ def test_play_selected_triggers_flip():
 def test_play_selected_triggers_glow():
     view, _ = make_view()
     sprite = DummyCardSprite()
-    view.selected = [sprite]
+    view.selected = {sprite}
     view.hand_sprites = pygame.sprite.LayeredUpdates(sprite)
     with (
         patch.object(view.game, "is_valid", return_value=(True, "")),
@@ -480,7 +480,7 @@ def test_play_selected_triggers_glow():
 def test_play_selected_triggers_bomb_reveal():
     view, _ = make_view()
     sprite = DummyCardSprite()
-    view.selected = [sprite]
+    view.selected = {sprite}
     view.hand_sprites = pygame.sprite.LayeredUpdates(sprite)
     with (
         patch.object(view.game, "is_valid", return_value=(True, "")),
@@ -527,7 +527,7 @@ def test_ai_turns_triggers_pass_animation():
 def test_play_selected_shakes_on_invalid():
     view, _ = make_view()
     sprite = DummyCardSprite()
-    view.selected = [sprite]
+    view.selected = {sprite}
     view.hand_sprites = pygame.sprite.LayeredUpdates(sprite)
     with (
         patch.object(view.game, "is_valid", return_value=(False, "bad")),